@@ -0,0 +1,177 @@
+import contextlib
+import io
+import random
+import time
+from typing import Dict, Iterable
+
+import numpy as np
+
+from knihovna import kernels, maze_generator
+from knihovna.maze_template import create_backtracker_tem
+from knihovna.solve_maze import solve
+
+"""
+Jednoduché měření rychlosti generování a řešení bludišť.
+
+Spuštění z kořene repozitáře:
+    python -m knihovna.benchmark
+"""
+
+
+def benchmark_generation(
+    n: int = 100,
+    count: int = 20,
+    types: Iterable[int] = (1, 2, 3, 4, 5, 6, 7, 8, 9)
+) -> Dict[str, Dict[str, float]]:
+    """
+    Změří generování bludišť pomocí create_maze a create_guaranteed_maze.
+
+    Pro každý typ šablony vygeneruje `count` bludišť a zaznamená:
+    - průměrný čas na jedno bludiště,
+    - úspěšnost (podíl bludišť, která nejsou None a jdou vyřešit),
+    - průměrný počet volání solve uvnitř generátoru na jedno bludiště.
+
+    Kontrola řešitelnosti probíhá mimo měřený čas
+    a do počtu volání solve se nezapočítává.
+    Každý režim se před měřením jednou zavolá nanečisto,
+    aby se do času nepočítal překlad jader (numba).
+    Všechny režimy běží se semínky 0 až count - 1
+    (create_maze přes random.seed), výsledky jsou tedy opakovatelné.
+
+    Args:
+        n (int): Velikost bludišť (n x n).
+        count (int): Počet bludišť pro každý typ.
+        types (Iterable[int]): Typy šablon pro create_maze.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Výsledky podle názvu režimu
+        s klíči "time", "success_rate" a "solves_per_maze".
+    """
+    calls = [0]
+
+    def counting_solve(matrix):
+        calls[0] += 1
+        return solve(matrix)
+
+    generators = {
+        f"create_maze(t={t})": (
+            lambda seed, t=t: maze_generator.create_maze(n, t)
+        )
+        for t in types
+    }
+    generators["create_guaranteed_maze"] = (
+        lambda seed: maze_generator.create_guaranteed_maze(n, seed)
+    )
+
+    results = {}
+    original_solve = maze_generator.solve
+    maze_generator.solve = counting_solve
+    try:
+        for name, generate in generators.items():
+            # jedno volání nanečisto: překlad jader (numba), sestavení
+            # topologie apod. se jinak připíše prvnímu měřenému režimu
+            with contextlib.redirect_stdout(io.StringIO()):
+                generate(0)
+            calls[0] = 0
+            elapsed = 0.0
+            successes = 0
+            for seed in range(count):
+                # create_maze bere náhodu z modulu random,
+                # semínko tedy nastavíme mimo měřený čas
+                random.seed(seed)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    start = time.perf_counter()
+                    maze = generate(seed)
+                    elapsed += time.perf_counter() - start
+                    if maze is not None and solve(maze) is not None:
+                        successes += 1
+            results[name] = {
+                "time": elapsed / count,
+                "success_rate": successes / count,
+                "solves_per_maze": calls[0] / count,
+            }
+    finally:
+        maze_generator.solve = original_solve
+
+    return results
+
+
+def print_results(results: Dict[str, Dict[str, float]]) -> None:
+    """
+    Vypíše výsledky měření jako tabulku.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): Výstup měřicí funkce.
+    """
+    for name, row in results.items():
+        values = "  ".join(
+            f"{key}={value:.4f}" for key, value in row.items()
+        )
+        print(f"{name:<28} {values}")
+
+
+def benchmark_kernels(
+    n: int = 1000,
+    seed: int = 0
+) -> Dict[str, Dict[str, float]]:
+    """
+    Porovná přeložená jádra (numba) s pythonní variantou.
+
+    Měří solve na dokonalém bludišti (dlouhá cesta, BFS projde
+    většinu buněk) a celé create_maze(n, 3) včetně falešných cest.
+    Pro stejné semínko ověří, že obě varianty dají stejný výsledek.
+    První volání přeložené varianty (překlad) se do času nepočítá.
+
+    Args:
+        n (int): Velikost bludiště (n x n).
+        seed (int): Semínko generátoru náhodných čísel.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Časy obou variant
+        a zrychlení podle názvu měřené funkce.
+    """
+    if kernels.numba is None:
+        print("numba není nainstalována, měří se jen pythonní varianta.")
+
+    maze = create_backtracker_tem(n, seed) == 0
+    tasks = {
+        "solve": lambda: solve(maze),
+        "create_maze(t=3)": lambda: maze_generator.create_maze(n, 3),
+    }
+    variants = [False, True] if kernels.numba is not None else [False]
+
+    results = {}
+    original = kernels.USE_NUMBA
+    try:
+        for name, task in tasks.items():
+            times = {}
+            outputs = {}
+            for use_numba in variants:
+                kernels.USE_NUMBA = use_numba
+                with contextlib.redirect_stdout(io.StringIO()):
+                    if use_numba:
+                        task()  # překlad
+                    random.seed(seed)
+                    start = time.perf_counter()
+                    outputs[use_numba] = task()
+                    times[use_numba] = time.perf_counter() - start
+            row = {"python": times[False]}
+            if True in times:
+                first = outputs[False]
+                second = outputs[True]
+                if isinstance(first, tuple):
+                    first, second = first[0], second[0]
+                if not np.array_equal(first, second):
+                    raise RuntimeError(f"{name}: varianty se liší.")
+                row["numba"] = times[True]
+                row["speedup"] = times[False] / times[True]
+            results[name] = row
+    finally:
+        kernels.USE_NUMBA = original
+
+    return results
+
+
+if __name__ == "__main__":
+    print_results(benchmark_generation())
+    print_results(benchmark_kernels())
@@ -0,0 +1,170 @@
+from typing import Callable, Tuple
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba je volitelná závislost
+    numba = None
+
+"""
+Volitelně kompilované (numba) jádro nejnáročnějších smyček.
+
+Pokud je nainstalována knihovna numba, funkce se přeloží při prvním
+volání a solve / create_maze je použijí automaticky. Bez numby
+se používá původní čistě pythonní implementace.
+Všechny funkce pracují jen s poli NumPy a celými čísly,
+takže stejný kód běží i jako obyčejný Python (kernel_func).
+"""
+
+USE_NUMBA = numba is not None
+# lze přepnout na False a vynutit pythonní variantu (např. pro měření)
+
+
+def _jit(func: Callable) -> Callable:
+    """
+    Přeloží funkci pomocí numba.njit, pokud je numba k dispozici.
+
+    Args:
+        func (Callable): Funkce k překladu.
+
+    Returns:
+        Callable: Přeložená funkce, nebo původní funkce bez numby.
+    """
+    if numba is None:
+        return func
+    return numba.njit(cache=True)(func)
+
+
+def kernel_func(func: Callable) -> Callable:
+    """
+    Vrátí přeloženou variantu funkce, nebo její pythonní předlohu,
+    pokud je USE_NUMBA vypnuté.
+
+    Args:
+        func (Callable): Funkce z tohoto modulu.
+
+    Returns:
+        Callable: Funkce, kterou se má volat.
+    """
+    if USE_NUMBA:
+        return func
+    return getattr(func, "py_func", func)
+
+
+@_jit
+def bfs_parents(
+    passable: np.ndarray,
+    offsets: np.ndarray,
+    start: int,
+    end: int
+) -> Tuple[np.ndarray, bool]:
+    """
+    BFS nad plochou maticí obalenou rámečkem zdí (GridTopology.pad).
+
+    Pořadí sousedů (offsets) i zacházení s cílovou buňkou
+    odpovídá funkci solve, výsledná cesta je tedy stejná.
+
+    Args:
+        passable (np.ndarray): Ploché logické pole, True = průchozí.
+        offsets (np.ndarray): Posuny sousedů (GridTopology.offsets).
+        start (int): Index počáteční buňky.
+        end (int): Index cílové buňky.
+
+    Returns:
+        Tuple[np.ndarray, bool]: Pole předků (-1 = bez předka)
+        a příznak, zda byl nalezen cíl.
+    """
+    size = passable.shape[0]
+    parent = np.full(size, -1, dtype=np.int64)
+    visited = np.zeros(size, dtype=np.bool_)
+    queue = np.empty(size, dtype=np.int64)
+
+    visited[start] = True
+    queue[0] = start
+    head = 0
+    tail = 1
+    while head < tail:
+        cur = queue[head]
+        head += 1
+        for d in range(offsets.shape[0]):
+            nb = cur + offsets[d]
+            if nb == end:
+                parent[nb] = cur
+                return parent, True
+            if not visited[nb] and passable[nb]:
+                visited[nb] = True
+                parent[nb] = cur
+                queue[tail] = nb
+                tail += 1
+
+    return parent, False
+
+
+@_jit
+def trace_path(parent: np.ndarray, end: int) -> np.ndarray:
+    """
+    Zrekonstruuje cestu z pole předků (obdoba show_path).
+
+    Args:
+        parent (np.ndarray): Pole předků z bfs_parents.
+        end (int): Plochý index cílové buňky.
+
+    Returns:
+        np.ndarray: Ploché indexy buněk cesty od začátku do cíle.
+    """
+    p = 0
+    cur = end
+    while cur != -1:
+        p += 1
+        cur = parent[cur]
+
+    steps = np.empty(p, dtype=np.int64)
+    cur = end
+    for k in range(p - 1, -1, -1):
+        steps[k] = cur
+        cur = parent[cur]
+    return steps
+
+
+@_jit
+def carve_walks(
+    maze: np.ndarray,
+    table: np.ndarray,
+    count: np.ndarray,
+    starts: np.ndarray,
+    path_length: int,
+    rand: np.ndarray
+) -> None:
+    """
+    Vyhloubí falešné cesty náhodnou procházkou (smyčka z create_maze).
+
+    Náhodná čísla jsou vylosovaná předem (rand), takže přeložená
+    i pythonní varianta dají pro stejné semínko stejné bludiště.
+    V každém kroku se zkusí až 5 náhodných sousedů
+    a vyhloubí se první, který je zdí.
+
+    Args:
+        maze (np.ndarray): Plochá matice bludiště (0 = cesta, 1 = zeď),
+            upravuje se na místě.
+        table (np.ndarray): Tabulka sousedů (GridTopology.neighbor_table).
+        count (np.ndarray): Počty sousedů (GridTopology.neighbor_count).
+        starts (np.ndarray): Ploché indexy počátků falešných cest.
+        path_length (int): Maximální délka jedné falešné cesty.
+        rand (np.ndarray): Náhodná čísla z [0, 1) tvaru
+            (len(starts), path_length, 5).
+    """
+    end = maze.shape[0] - 1
+    for s in range(starts.shape[0]):
+        cur = starts[s]
+        for step in range(path_length):
+            if cur == end:
+                break
+            maze[cur] = 0
+            nxt = cur
+            for k in range(5):
+                # náhodný soused v pořadí podle tabulky
+                nxt = table[cur, int(rand[s, step, k] * count[cur])]
+                if maze[nxt] == 1:
+                    maze[nxt] = 0
+                    break
+            cur = nxt
@@ -0,0 +1,416 @@
+import contextlib
+import io
+import os
+import random
+import struct
+from typing import Iterable, Iterator, Optional, Tuple
+import numpy as np
+
+from knihovna.maze_generator import create_maze
+from knihovna.solve_maze import solve
+
+"""
+Archiv bludišť v jediném souboru.
+
+Místo statisíců souborů CSV/PNG se bludiště ukládají do jednoho
+souboru, který se čte přes memory-map (np.memmap). Rozložení souboru:
+
+    hlavička (HEADER_SIZE bajtů): magické číslo, verze,
+        kapacita indexu, pozice indexu, počet bludišť
+    index: pole INDEX_DTYPE s pozicí a metadaty každého bludiště,
+        s rezervou volných míst (kapacitou) pro další bludiště
+    data: bludiště zabalená po bitech (np.packbits, True = průchozí),
+        nová bludiště se vždy jen připisují na konec souboru
+
+Při přidání bludišť se nová data zapíšou za konec souboru a jejich
+záznamy do volných míst indexu za posledním platným záznamem.
+Pokud se do indexu nevejdou, zapíše se za data nový index s dvojnásobnou
+kapacitou (místo po starém zůstane nevyužité, celkem ale nanejvýš
+tolik, kolik zabírá platný index). Hlavička s novým počtem bludišť
+se přepíše teprve po uložení dat a indexu na disk (fsync). Dokud
+není hlavička zapsaná, platí původní obsah, přerušené přidání
+tedy archiv nepoškodí.
+"""
+
+MAGIC = b"MAZEARC1"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQ")
+# magické číslo, verze, kapacita indexu, pozice indexu, počet bludišť
+HEADER_SIZE = HEADER.size
+INDEX_RESERVE = 1024
+# počet míst v indexu nově vytvořeného archivu
+
+INDEX_DTYPE = np.dtype([
+    ("offset", "<u8"),  # pozice zabaleného bludiště v souboru
+    ("n", "<u4"),  # velikost bludiště (n x n)
+    ("t", "<i4"),  # typ šablony (0 = neznámý)
+    ("seed", "<i8"),  # semínko generátoru (-1 = neznámé)
+    ("solution_length", "<i4"),  # počet buněk řešení (-1 = bez řešení)
+])
+
+
+def _packed_size(n: int) -> int:
+    """
+    Vrátí počet bajtů bludiště n x n zabaleného po bitech.
+    """
+    return (n * n + 7) // 8
+
+
+def _read_header(f) -> Tuple[int, int, int]:
+    """
+    Přečte hlavičku archivu.
+
+    Args:
+        f: Soubor otevřený pro binární čtení.
+
+    Returns:
+        Tuple[int, int, int]: Pozice indexu, počet bludišť
+        a kapacita indexu (počet míst, nejméně počet bludišť).
+    """
+    f.seek(0)
+    magic, version, capacity, index_offset, count = HEADER.unpack(
+        f.read(HEADER_SIZE)
+    )
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Soubor není archiv bludišť.")
+    return index_offset, count, max(capacity, count)
+
+
+def _sync(f) -> None:
+    """
+    Zapíše vyrovnávací paměť souboru až na disk.
+    """
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _append_records(
+    path: str,
+    records: Iterable[Tuple[np.ndarray, int, Optional[int]]],
+    t: int
+) -> int:
+    """
+    Připíše bludiště na konec archivu (archiv případně vytvoří).
+
+    Záznamy se čtou postupně, v paměti se drží jen jedno bludiště
+    a řádky indexu nových bludišť.
+
+    Args:
+        path (str): Cesta k souboru archivu.
+        records (Iterable[Tuple[np.ndarray, int, Optional[int]]]):
+            Trojice (bludiště, semínko, délka řešení). Pokud délka
+            chybí (None), spočítá se funkcí solve.
+        t (int): Typ šablony, ze které bludiště vznikla (0 = neznámý).
+
+    Returns:
+        int: Počet bludišť v archivu po připsání.
+
+    Raises:
+        ValueError: Pokud bludiště není čtvercová matice.
+    """
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, INDEX_RESERVE, HEADER_SIZE, 0))
+            f.write(bytes(INDEX_RESERVE * INDEX_DTYPE.itemsize))
+
+    with open(path, "r+b") as f:
+        index_offset, count, capacity = _read_header(f)
+
+        # nová data jdou za konec souboru, platný index se nemění
+        end = f.seek(0, os.SEEK_END)
+        offset = end
+        new_entries = []
+        try:
+            for maze, seed, length in records:
+                maze = np.asarray(maze, dtype=bool)
+                if maze.ndim != 2 or maze.shape[0] != maze.shape[1]:
+                    raise ValueError(
+                        f"Bludiště musí být čtvercová matice, "
+                        f"ne tvaru {maze.shape}."
+                    )
+                if length is None:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        result = solve(maze)
+                    length = result[1] if result is not None else -1
+                f.write(np.packbits(maze.ravel()).tobytes())
+                new_entries.append((offset, maze.shape[0], t, seed, length))
+                offset += _packed_size(maze.shape[0])
+
+            new_index = np.array(new_entries, dtype=INDEX_DTYPE)
+            total = count + len(new_index)
+            if total <= capacity:
+                # záznamy do volných míst za posledním platným záznamem,
+                # čtenáři je uvidí až po přepsání hlavičky
+                f.seek(index_offset + count * INDEX_DTYPE.itemsize)
+                f.write(new_index.tobytes())
+            else:
+                # index se nevejde: nový s dvojnásobnou kapacitou za data
+                f.seek(index_offset)
+                old_index = f.read(count * INDEX_DTYPE.itemsize)
+                capacity = max(2 * total, INDEX_RESERVE)
+                index_offset = offset
+                f.seek(index_offset)
+                f.write(old_index)
+                f.write(new_index.tobytes())
+                f.write(bytes((capacity - total) * INDEX_DTYPE.itemsize))
+            _sync(f)
+        except BaseException:
+            # hlavička ukazuje pořád na starý index, jen uklidíme konec
+            f.truncate(end)
+            raise
+
+        # hlavičku přepíšeme až po uložení dat a indexu
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, capacity, index_offset, total))
+        _sync(f)
+
+    return total
+
+
+def append_to_archive(
+    path: str,
+    mazes: Iterable[np.ndarray],
+    t: int = 0,
+    seeds: Optional[Iterable[int]] = None,
+    solution_lengths: Optional[Iterable[int]] = None
+) -> int:
+    """
+    Připíše bludiště na konec archivu (archiv případně vytvoří).
+
+    Bludiště se zapisují postupně, `mazes` tedy může být i generátor.
+    Každé volání dvakrát čeká na zápis na disk (fsync), dávku bludišť
+    je proto lepší předat jedním voláním než volat funkci pro každé zvlášť.
+    Pokud během zápisu nastane chyba (např. vadné bludiště nebo výjimka
+    v iterátoru `mazes`), soubor se zkrátí na původní délku
+    a archiv zůstane beze změny.
+
+    Args:
+        path (str): Cesta k souboru archivu.
+        mazes (Iterable[np.ndarray]): Čtvercové logické matice
+            (True = průchozí).
+        t (int): Typ šablony, ze které bludiště vznikla (0 = neznámý).
+        seeds (Optional[Iterable[int]]): Semínka jednotlivých bludišť.
+        solution_lengths (Optional[Iterable[int]]): Délky řešení,
+            pokud chybí, spočítají se funkcí solve.
+
+    Returns:
+        int: Počet bludišť v archivu po připsání.
+
+    Raises:
+        ValueError: Pokud bludiště není čtvercová matice
+            nebo chybí semínko či délka řešení.
+    """
+    seed_iter = iter(seeds) if seeds is not None else None
+    length_iter = (
+        iter(solution_lengths) if solution_lengths is not None else None
+    )
+
+    def records():
+        for maze in mazes:
+            seed = -1
+            if seed_iter is not None:
+                seed = next(seed_iter, None)
+                if seed is None:
+                    raise ValueError("Chybí semínko bludiště.")
+            length = None
+            if length_iter is not None:
+                length = next(length_iter, None)
+                if length is None:
+                    raise ValueError("Chybí délka řešení bludiště.")
+            yield maze, seed, length
+
+    return _append_records(path, records(), t)
+
+
+def compact_archive(path: str) -> int:
+    """
+    Přepíše archiv bez míst po starých indexech a bez volných míst.
+
+    Archiv se zapíše do dočasného souboru vedle původního
+    a ten se jím nahradí (os.replace), takže i přerušené
+    zhuštění nechá platný původní archiv.
+
+    Args:
+        path (str): Cesta k souboru archivu.
+
+    Returns:
+        int: Velikost archivu v bajtech po zhuštění.
+    """
+    tmp_path = path + ".tmp"
+    with open(path, "rb") as src:
+        index_offset, count, _ = _read_header(src)
+        src.seek(index_offset)
+        index = np.frombuffer(
+            src.read(count * INDEX_DTYPE.itemsize), dtype=INDEX_DTYPE
+        ).copy()
+        with open(tmp_path, "wb") as dst:
+            offset = dst.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+            for k in range(count):
+                size = _packed_size(int(index["n"][k]))
+                src.seek(int(index["offset"][k]))
+                dst.write(src.read(size))
+                index["offset"][k] = offset
+                offset += size
+            dst.write(index.tobytes())
+            dst.seek(0)
+            dst.write(HEADER.pack(MAGIC, VERSION, count, offset, count))
+            _sync(dst)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def generate_to_archive(
+    path: str,
+    n: int,
+    t: int,
+    seeds: Iterable[int]
+) -> int:
+    """
+    Vygeneruje bludiště funkcí create_maze a uloží je do archivu.
+
+    Před každým bludištěm se nastaví random.seed(seed),
+    bludiště lze tedy podle metadat kdykoli vytvořit znovu.
+    Bludiště se zapisují hned po vygenerování, v paměti
+    je vždy jen jedno.
+
+    Args:
+        path (str): Cesta k souboru archivu.
+        n (int): Velikost bludišť (n x n).
+        t (int): Typ šablony pro create_maze.
+        seeds (Iterable[int]): Semínka jednotlivých bludišť.
+
+    Returns:
+        int: Počet bludišť v archivu po připsání.
+    """
+    def records():
+        for seed in seeds:
+            random.seed(seed)
+            with contextlib.redirect_stdout(io.StringIO()):
+                maze = create_maze(n, t)
+            if maze is not None:
+                yield maze, seed, None
+
+    return _append_records(path, records(), t)
+
+
+def import_csv_folder(path: str, folder: str) -> int:
+    """
+    Převede všechna bludiště CSV ze složky (např. 'data') do archivu.
+
+    Soubory CSV mají 0 pro průchozí buňky a 1 pro zdi.
+
+    Args:
+        path (str): Cesta k souboru archivu.
+        folder (str): Složka se soubory CSV.
+
+    Returns:
+        int: Počet bludišť v archivu po převodu.
+    """
+    names = sorted(
+        name for name in os.listdir(folder) if name.endswith(".csv")
+    )
+    mazes = (
+        np.loadtxt(os.path.join(folder, name), delimiter=",") == 0
+        for name in names
+    )
+    return append_to_archive(path, mazes)
+
+
+class MazeArchive:
+    """
+    Archiv bludišť otevřený pro čtení přes memory-map.
+
+    Jednotlivá bludiště se čtou v čase O(1) podle indexu,
+    ze souboru se načtou jen bajty daného bludiště.
+
+    Attributes:
+        index (np.ndarray): Pole INDEX_DTYPE s metadaty všech bludišť.
+
+    Příklad:
+        with MazeArchive("mazes.bin") as archive:
+            for i, maze in archive.iter_mazes(archive.select(n=100)):
+                ...
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            index_offset, count, _ = _read_header(f)
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        self.index = self._data[
+            index_offset:index_offset + count * INDEX_DTYPE.itemsize
+        ].view(INDEX_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        """
+        Vrátí i-té bludiště jako logickou matici (True = průchozí).
+        """
+        entry = self.index[i]
+        n = int(entry["n"])
+        start = int(entry["offset"])
+        packed = self._data[start:start + _packed_size(n)]
+        return np.unpackbits(packed, count=n * n).reshape(n, n).astype(bool)
+
+    def select(
+        self,
+        n: Optional[int] = None,
+        t: Optional[int] = None,
+        min_length: Optional[int] = None,
+        max_length: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Vybere bludiště podle metadat (bez čtení samotných dat).
+
+        Args:
+            n (Optional[int]): Velikost bludiště.
+            t (Optional[int]): Typ šablony.
+            min_length (Optional[int]): Nejmenší délka řešení.
+            max_length (Optional[int]): Největší délka řešení.
+
+        Returns:
+            np.ndarray: Indexy vybraných bludišť.
+        """
+        mask = np.ones(len(self.index), dtype=bool)
+        if n is not None:
+            mask &= self.index["n"] == n
+        if t is not None:
+            mask &= self.index["t"] == t
+        if min_length is not None:
+            mask &= self.index["solution_length"] >= min_length
+        if max_length is not None:
+            mask &= self.index["solution_length"] <= max_length
+        return np.flatnonzero(mask)
+
+    def iter_mazes(
+        self,
+        indices: Optional[Iterable[int]] = None
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Postupně vrací vybraná bludiště, ostatní se vůbec nečtou.
+
+        Args:
+            indices (Optional[Iterable[int]]): Indexy bludišť
+                (např. ze select), None = všechna.
+
+        Yields:
+            Tuple[int, np.ndarray]: Index a matice bludiště.
+        """
+        if indices is None:
+            indices = range(len(self.index))
+        for i in indices:
+            yield int(i), self[int(i)]
+
+    def close(self) -> None:
+        """
+        Uvolní memory-map souboru (po zrušení všech odkazů na něj).
+        """
+        self.index = None
+        self._data = None
+
+    def __enter__(self) -> "MazeArchive":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
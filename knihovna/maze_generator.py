@@ -1,11 +1,11 @@
+import os
 import random
-from typing import Tuple, Optional
+from typing import Optional
 import numpy as np
 
-from knihovna.solve_maze import (
-    get_neighbors,
-    solve,
-)
+from knihovna import kernels
+from knihovna.topology import get_topology
+from knihovna.solve_maze import solve
 
 from knihovna.maze_template import (
     create_simple_tem,
@@ -13,26 +13,15 @@ from knihovna.maze_template import (
     create_best_tem,
     create_turbo_tem,
     create_tem_with_fake_paths,
+    create_random_path_tem,
+    create_backtracker_tem,
+    create_kruskal_tem,
+    create_prim_tem,
+    create_eller_tem,
+    eller_rows,
     )
 
 
-def rand_dir(i: int, j: int, n: int) -> Tuple[int, int]:
-    """
-    Vybere náhodného souseda buňky (i, j) v mřížce velikosti n x n.
-
-    Args:
-        i (int): Řádek aktuální buňky.
-        j (int): Sloupec aktuální buňky.
-        n (int): Velikost strany čtvercové mřížky.
-
-    Returns:
-        Tuple[int, int]: Souřadnice vybraného souseda.
-    """
-    neighbors = get_neighbors(i, j, n)
-    cur_dir = random.choice(neighbors)
-    return cur_dir
-
-
 # t různých šablon pro generování bludiště
 
 def create_maze(n: int, t: int) -> Optional[np.ndarray]:
@@ -41,7 +30,11 @@ def create_maze(n: int, t: int) -> Optional[np.ndarray]:
 
     Args:
         n (int): Velikost bludiště (n x n), musí být v rozsahu 12–1000.
-        t (int): Typ šablony (1–5).
+        t (int): Typ šablony (1–9).
+            6–9 jsou dokonalá bludiště (backtracker, Kruskal, Prim, Eller),
+            která už falešné cesty obsahují, proto se vrací rovnou.
+            Jejich semínko se bere z modulu random, takže random.seed
+            je zopakuje stejně jako typy 1–5.
 
     Returns:
         Optional[np.ndarray]: Matice bludiště,
@@ -63,6 +56,21 @@ def create_maze(n: int, t: int) -> Optional[np.ndarray]:
         maze = create_turbo_tem(n)
     elif t == 5:
         maze = create_tem_with_fake_paths(n, 5)
+    elif t in (6, 7, 8, 9):
+        # dokonalé bludiště je průchozí z principu konstrukce,
+        # solve ani přidávání falešných cest tedy nepotřebujeme;
+        # semínko bereme z modulu random, aby random.seed platil i zde
+        seed = random.getrandbits(64)
+        if t == 6:
+            maze = create_backtracker_tem(n, seed)
+        elif t == 7:
+            maze = create_kruskal_tem(n, seed)
+        elif t == 8:
+            maze = create_prim_tem(n, seed)
+        else:
+            maze = create_eller_tem(n, seed)
+        print("Bludiště bylo úspěšně vygenerováno.")
+        return (maze == 0)
     else:
         print("Neplatný typ šablony. Používám jednoduchou šablonu.")
         maze = create_simple_tem(n)
@@ -94,93 +102,144 @@ def create_maze(n: int, t: int) -> Optional[np.ndarray]:
                 print("Cesta nebyla nalezena ani po vytvoření nové šablony.")
                 return None
     # pokud je cesta nalezena, uložíme ji do proměnných
-    path_map, _, win_steps = result
+    _, _, win_steps = result
 
     # Přidáme náhodné falešné cesty do bludiště
     num_paths = n // 3
     # (podle mě) optimální počet falešných cest
     path_length = n - n // 3
     # (opět podle mě) optimální délka falešných cest
-    opt_path_start = n - n // 4
-    # chceme, aby falešné cesty prvních n // 3 buněk vedly dál od win_steps
 
-    # path_map využijeme pro uložení všech možných cest (včetně falešných)
     # pomocí slice ořezáváme win_steps, aby se vyhnuly okrajům
     # a získali jsme pouze vnitřní buňky, kde můžeme přidávat falešné cesty
     opt_steps = win_steps[2:-2]
     paths = random.sample(opt_steps, num_paths)
     # z opt_steps náhodně vybereme optimální počet cest,
     # ze kterých povedou falešné cesty
-    c = 0  # count pro počet kroků
 
-    for (i, j) in paths:
-        for _ in range(path_length):
-            # pokud jsme na okraji, tak už nemůžeme pokračovat
-            if (i, j) == (n - 1, n - 1):
-                break
-            if c == 0:
-                maze[i, j] = 0  # nastavíme aktuální buňku jako průchozí
-                path_map[i, j] = True  # nastavíme buňku jako součást cesty
-            elif c <= opt_path_start:
-                # nejprve zjistíme, kteří sousedi buňky jsou součástí win_steps
-                neighbors = get_neighbors(i, j, n)
-                for ni, nj in neighbors:
-                    if (ni, nj) not in win_steps:
-                        if path_map[ni, nj] is False:
-                            # pokud není buňka součástí cesty
-                            maze[ni, nj] = 0
-                            path_map[ni, nj] = True
-                            # nastavíme buňku jako součást cesty
-                        # zjistíme, kterým směrem jsme se posunuli
-                        # z aktuální buňky (i, j) do sousední buňky (ni, nj)
-                        direction = None
-                        di = ni - i
-                        dj = nj - j
-
-                        if di == -1 and dj == 0:
-                            direction = (-1, 0)  # nahoru
-                        elif di == 1 and dj == 0:
-                            direction = (1, 0)  # dolů
-                        elif di == 0 and dj == -1:
-                            direction = (0, -1)  # doleva
-                        elif di == 0 and dj == 1:
-                            direction = (0, 1)  # doprava
-                        if direction is not None:
-                            # posuneme se z buňky (ni, nj) o daný směr
-                            ni += direction[0]
-                            nj += direction[1]
-                        while (
-                            c <= opt_path_start
-                            and (0 <= ni < n and 0 <= nj < n)
-                        ):
-                            # pokud jsme v rámci matice,
-                            # nastavíme buňku jako průchozí
-                            maze[ni, nj] = 0
-                            # posuneme se o daný směr
-                            ni += direction[0]
-                            nj += direction[1]
-                            # zvýšíme počet kroků
-                            c += 1
-            # pokud už nejsme na začátku falešné cesty,
-            # můžeme nový směr dát jako random
-            # nastavíme aktuální buňku jako průchozí
-            # náhodně zvolíme směr
-            ni, nj = rand_dir(i, j, n)
-            if maze[ni, nj] == 1:  # pokud je buňka volná
-                maze[ni, nj] = 0  # vytvoříme falešnou cestu
-            elif maze[ni, nj] == 0:  # pokud je buňka průchozí
-                for _ in range(4):
-                    # tři další pokusy o nalezení průchozí buňky
-                    ni, nj = rand_dir(i, j, n)
-                    if maze[ni, nj] == 1:
-                        # nastavíme aktuální buňku jako průchozí
-                        maze[ni, nj] = 0
-                        break
-            i, j = ni, nj
-            # nakonec vytvoříme novou matici, která je nové bludiště,
+    # náhodná čísla pro procházky vylosujeme předem,
+    # aby přeložená (numba) i pythonní varianta daly stejné bludiště
+    rng = np.random.default_rng(random.getrandbits(64))
+    rand = rng.random((num_paths, path_length, 5))
+    maze = np.array(maze, dtype=np.int64)
+    topology = get_topology(n, n)
+    kernels.kernel_func(kernels.carve_walks)(
+        maze.ravel(),
+        topology.neighbor_table,
+        topology.neighbor_count,
+        np.array([i * n + j for i, j in paths], dtype=np.int64),
+        path_length,
+        rand
+    )
+    # nakonec vytvoříme novou matici, která je nové bludiště,
     # kde 0 znamená průchozí buňku
     # a 1 znamená neprůchozí buňku
     # a uložíme ji do CSV souboru
     new_maze = (maze == 0)
     print("Bludiště bylo úspěšně vygenerováno.")
     return new_maze
+
+
+def create_guaranteed_maze(
+    n: int,
+    seed: Optional[int] = None
+) -> Optional[np.ndarray]:
+    """
+    Vygeneruje bludiště, které je průchozí už z principu konstrukce.
+
+    Na rozdíl od create_maze se nevolá solve ani se neopakují pokusy:
+    hlavní cesta vzniká konstruktivně (create_random_path_tem)
+    a falešné cesty se vyhlubují jako stromy, tj. nová buňka se otevře
+    jen tehdy, když sousedí pouze s buňkou, ze které do ní vstupujeme.
+    Falešné cesty tak nikdy nepropojí dvě místa hlavní cesty
+    a řešení zůstává jediné.
+
+    Args:
+        n (int): Velikost bludiště (n x n), musí být v rozsahu 12–1000.
+        seed (Optional[int]): Semínko generátoru náhodných čísel.
+
+    Returns:
+        Optional[np.ndarray]: Matice bludiště,
+        (kde True = průchozí, False = zeď)
+        nebo None při chybě.
+    """
+    if n < 12 or n > 1000:
+        print("Velikost matice musí být v rozmezí 12 až 1000.")
+        return None
+
+    rng = random.Random(seed)
+    maze, win_steps = create_random_path_tem(n, 4, rng)
+
+    # stejné parametry falešných cest jako v create_maze
+    num_paths = n // 3
+    path_length = n - n // 3
+    opt_steps = win_steps[2:-2]
+    paths = rng.sample(opt_steps, min(num_paths, len(opt_steps)))
+
+    # matice obalená rámečkem (2 = mimo matici), sousedy tak
+    # získáme přičtením posunů bez kontroly hranic
+    topology = get_topology(n, n)
+    offsets = topology.offsets
+    padded = topology.pad(maze, 2).tolist()
+
+    for (i, j) in paths:
+        cur = topology.padded_index(i, j)
+        for _ in range(path_length):
+            candidates = []
+            for d in offsets:
+                nb = cur + d
+                if padded[nb] != 1:
+                    continue  # jen zeď uvnitř matice
+                # buňku otevřeme jen tehdy, pokud by se nedotkla
+                # jiné průchozí buňky než té aktuální
+                touches = False
+                for e in offsets:
+                    k = nb + e
+                    if k != cur and padded[k] == 0:
+                        touches = True
+                        break
+                if not touches:
+                    candidates.append(nb)
+            if not candidates:
+                break  # slepá ulička
+            cur = rng.choice(candidates)
+            padded[cur] = 0
+
+    maze = np.array(padded).reshape(n + 2, n + 2)[1:-1, 1:-1]
+    new_maze = (maze == 0)
+    print("Bludiště bylo úspěšně vygenerováno.")
+    return new_maze
+
+
+def save_eller_maze_csv(
+    height: int,
+    width: int,
+    nazev: str,
+    seed: Optional[int] = None
+) -> None:
+    """
+    Vygeneruje Ellerovým algoritmem bludiště a zapisuje ho rovnou do CSV.
+
+    Řádky se zapisují postupně, takže výška bludiště není omezena
+    pamětí (potřeba je jen O(width)). Formát odpovídá souborům
+    ve složce 'data' (0 = cesta, 1 = zeď).
+    Výsledný soubor se uloží do složky 'generated_mazes'.
+
+    Args:
+        height (int): Počet řádků bludiště.
+        width (int): Počet sloupců bludiště.
+        nazev (str): Název výstupního souboru (bez přípony).
+        seed (Optional[int]): Semínko generátoru náhodných čísel.
+    """
+    output_dir = os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "generated_mazes"
+    )
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f"{nazev}.csv")
+
+    with open(output_path, "w") as f:
+        for row in eller_rows(height, width, seed):
+            f.write(",".join(map(str, row.tolist())) + "\n")
+    print(f"Bludiště uloženo jako '{output_path}'.")
@@ -1,5 +1,6 @@
 import numpy as np
 import random
+from typing import Iterator, List, Optional, Tuple
 
 
 # n - velikost matice (n x n)
@@ -380,3 +381,407 @@ def create_tem_with_fake_paths(n: int, f: int) -> np.ndarray:
         template[n - 1, j] = 0
 
     return template
+
+
+# g - gap - maximální rozestup vodorovných chodeb
+def create_random_path_tem(
+    n: int,
+    g: int,
+    rng: random.Random
+) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+    """
+    Vytvoří šablonu s náhodnou hlavní cestou, která vždy vede do cíle.
+
+    Cesta se skládá z vodorovných chodeb (v řádcích vzdálených
+    2 až `g` od sebe) spojených svislými úseky v náhodných sloupcích.
+    Poslední chodba leží v řádku n - 1 a končí v pravém dolním rohu.
+    Protože se chodby navzájem nedotýkají, je cesta průchozí
+    už z principu konstrukce a není ji potřeba ověřovat funkcí solve.
+
+    Args:
+        n (int): Rozměr matice (n x n).
+        g (int): Maximální rozestup vodorovných chodeb (alespoň 2).
+        rng (random.Random): Generátor náhodných čísel.
+
+    Returns:
+        Tuple[np.ndarray, List[Tuple[int, int]]]:
+            Matice s hodnotami 0 (cesta) a 1 (zdi)
+            a seznam buněk hlavní cesty (od začátku do cíle).
+    """
+    template = np.ones((n, n), dtype=int)
+    path_steps: List[Tuple[int, int]] = []
+
+    i = 0
+    j = 0
+    while True:
+        # cílový sloupec vodorovné chodby
+        if i == n - 1:
+            new_j = n - 1
+        else:
+            new_j = rng.randrange(n - 1)
+            if new_j >= j:
+                new_j += 1  # nový sloupec se liší od aktuálního
+
+        # vodorovně k new_j
+        step = 1 if new_j > j else -1
+        for k in range(j, new_j, step):
+            template[i, k] = 0
+            path_steps.append((i, k))
+        j = new_j
+
+        if i == n - 1:
+            break
+
+        # svisle dolů k další chodbě,
+        # mezi chodbami zůstává vždy alespoň jeden řádek
+        new_i = i + rng.randint(2, g)
+        if new_i > n - 3:
+            new_i = n - 1
+        for k in range(i, new_i):
+            template[k, j] = 0
+            path_steps.append((k, j))
+        i = new_i
+
+    template[n - 1, n - 1] = 0
+    path_steps.append((n - 1, n - 1))
+    return template, path_steps
+
+
+"""
+Klasické algoritmy pro generování dokonalých bludišť
+(každé dvě místa spojuje právě jedna cesta).
+
+Místnosti leží na sudých souřadnicích (2r, 2c) matice,
+liché řádky a sloupce tvoří zdi mezi nimi. Stav algoritmů
+se drží v kompaktních polích NumPy indexovaných číslem místnosti
+r * cols + c, průchody se ukládají do polí `right` (rows x cols - 1)
+a `down` (rows - 1 x cols).
+"""
+
+
+def passages_to_tem(
+    height: int,
+    width: int,
+    right: np.ndarray,
+    down: np.ndarray
+) -> np.ndarray:
+    """
+    Převede pole průchodů mezi místnostmi na matici bludiště.
+
+    Pokud je rozměr matice sudý, zůstane poslední řádek/sloupec zdí,
+    kromě krátkého průchodu v pravém sloupci,
+    který spojí poslední místnost s pravým dolním rohem.
+
+    Args:
+        height (int): Počet řádků matice.
+        width (int): Počet sloupců matice.
+        right (np.ndarray): Logické pole (rows x cols - 1),
+            True = průchod do místnosti vpravo.
+        down (np.ndarray): Logické pole (rows - 1 x cols),
+            True = průchod do místnosti dole.
+
+    Returns:
+        np.ndarray: Matice s hodnotami 0 (cesta) a 1 (zdi).
+    """
+    rows = (height + 1) // 2
+    cols = (width + 1) // 2
+    template = np.ones((height, width), dtype=int)
+
+    template[0:2 * rows - 1:2, 0:2 * cols - 1:2] = 0  # místnosti
+    template[0:2 * rows - 1:2, 1:2 * cols - 2:2][right] = 0
+    template[1:2 * rows - 2:2, 0:2 * cols - 1:2][down] = 0
+    # průchod z poslední místnosti do pravého dolního rohu
+    template[2 * (rows - 1):, width - 1] = 0
+
+    return template
+
+
+def create_backtracker_tem(n: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Vytvoří dokonalé bludiště algoritmem recursive backtracker.
+
+    Místo rekurze se používá explicitní zásobník v poli NumPy,
+    takže algoritmus funguje i pro n = 1000 bez přetečení zásobníku.
+
+    Args:
+        n (int): Rozměr matice (n x n).
+        seed (Optional[int]): Semínko generátoru náhodných čísel.
+
+    Returns:
+        np.ndarray: Matice s hodnotami 0 (cesta) a 1 (zdi).
+    """
+    rng = np.random.default_rng(seed)
+    rows = cols = (n + 1) // 2
+    cells = rows * cols
+    right = np.zeros((rows, cols - 1), dtype=bool)
+    down = np.zeros((rows - 1, cols), dtype=bool)
+
+    visited = np.zeros(cells, dtype=bool)
+    stack = np.empty(cells, dtype=np.int32)
+    rand = rng.random(2 * cells)  # předem vylosovaná čísla
+    k = 0
+
+    stack[0] = 0
+    visited[0] = True
+    sp = 1
+    options = [0, 0, 0, 0]
+    while sp > 0:
+        cur = int(stack[sp - 1])
+        r, c = divmod(cur, cols)
+        # nenavštívení sousedé aktuální místnosti
+        m = 0
+        if r > 0 and not visited[cur - cols]:
+            options[m] = cur - cols
+            m += 1
+        if r < rows - 1 and not visited[cur + cols]:
+            options[m] = cur + cols
+            m += 1
+        if c > 0 and not visited[cur - 1]:
+            options[m] = cur - 1
+            m += 1
+        if c < cols - 1 and not visited[cur + 1]:
+            options[m] = cur + 1
+            m += 1
+
+        if m == 0:
+            sp -= 1  # slepá ulička, vracíme se
+            continue
+
+        nxt = options[int(rand[k] * m)]
+        k += 1
+        # vybourání zdi mezi cur a nxt
+        if nxt == cur - cols:
+            down[r - 1, c] = True
+        elif nxt == cur + cols:
+            down[r, c] = True
+        elif nxt == cur - 1:
+            right[r, c - 1] = True
+        else:
+            right[r, c] = True
+        visited[nxt] = True
+        stack[sp] = nxt
+        sp += 1
+
+    return passages_to_tem(n, n, right, down)
+
+
+def create_kruskal_tem(n: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Vytvoří dokonalé bludiště Kruskalovým algoritmem.
+
+    Všechny vnitřní zdi se náhodně zamíchají a zeď se vybourá,
+    pokud odděluje dvě dosud nespojené komponenty.
+    Komponenty se udržují v poli union-find se zkracováním cest.
+
+    Args:
+        n (int): Rozměr matice (n x n).
+        seed (Optional[int]): Semínko generátoru náhodných čísel.
+
+    Returns:
+        np.ndarray: Matice s hodnotami 0 (cesta) a 1 (zdi).
+    """
+    rng = np.random.default_rng(seed)
+    rows = cols = (n + 1) // 2
+    cells = rows * cols
+    ids = np.arange(cells, dtype=np.int32).reshape(rows, cols)
+
+    # hrany: nejprve všechny zdi vpravo, potom všechny zdi dole
+    a = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+    b = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+    order = rng.permutation(len(a))
+
+    # ve smyčce pracujeme se seznamy Pythonu, přístup k jednotlivým
+    # prvkům pole NumPy je výrazně pomalejší
+    parent = list(range(cells))
+    a_list = a.tolist()
+    b_list = b.tolist()
+    opened = []
+    for e in order.tolist():
+        x = a_list[e]
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        y = b_list[e]
+        while parent[y] != y:
+            parent[y] = parent[parent[y]]
+            y = parent[y]
+        if x != y:
+            parent[x] = y
+            opened.append(e)
+            if len(opened) == cells - 1:
+                break  # kostra je hotová
+
+    is_open = np.zeros(len(a), dtype=bool)
+    is_open[opened] = True
+    split = rows * (cols - 1)
+    right = is_open[:split].reshape(rows, cols - 1)
+    down = is_open[split:].reshape(rows - 1, cols)
+    return passages_to_tem(n, n, right, down)
+
+
+def create_prim_tem(n: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Vytvoří dokonalé bludiště randomizovaným Primovým algoritmem.
+
+    Bludiště roste z levého horního rohu. V každém kroku se
+    z hranice (pole nenavštívených sousedů) vybere náhodná místnost
+    a připojí se k náhodnému již navštívenému sousedovi.
+
+    Args:
+        n (int): Rozměr matice (n x n).
+        seed (Optional[int]): Semínko generátoru náhodných čísel.
+
+    Returns:
+        np.ndarray: Matice s hodnotami 0 (cesta) a 1 (zdi).
+    """
+    rng = np.random.default_rng(seed)
+    rows = cols = (n + 1) // 2
+    cells = rows * cols
+
+    # 0 = mimo, 1 = na hranici, 2 = v bludišti
+    # (seznamy Pythonu, přístup k prvkům pole NumPy je ve smyčce pomalý)
+    state = [0] * cells
+    frontier = [0] * cells
+    rand = rng.random(2 * cells).tolist()
+    right_flat = [False] * (rows * (cols - 1))
+    down_flat = [False] * ((rows - 1) * cols)
+    k = 0
+    size = 0
+
+    state[0] = 2
+    for nb in (1, cols):
+        state[nb] = 1
+        frontier[size] = nb
+        size += 1
+
+    options = [0, 0, 0, 0]
+    while size > 0:
+        # náhodná místnost z hranice (odebrání prohozením s poslední)
+        idx = int(rand[k] * size)
+        k += 1
+        cur = frontier[idx]
+        size -= 1
+        frontier[idx] = frontier[size]
+        r, c = divmod(cur, cols)
+
+        m = 0
+        for nb, ok in (
+            (cur - cols, r > 0),
+            (cur + cols, r < rows - 1),
+            (cur - 1, c > 0),
+            (cur + 1, c < cols - 1),
+        ):
+            if not ok:
+                continue
+            if state[nb] == 2:
+                options[m] = nb
+                m += 1
+            elif state[nb] == 0:
+                state[nb] = 1
+                frontier[size] = nb
+                size += 1
+
+        nxt = options[int(rand[k] * m)]
+        k += 1
+        if nxt == cur - cols:
+            down_flat[(r - 1) * cols + c] = True
+        elif nxt == cur + cols:
+            down_flat[r * cols + c] = True
+        elif nxt == cur - 1:
+            right_flat[r * (cols - 1) + c - 1] = True
+        else:
+            right_flat[r * (cols - 1) + c] = True
+        state[cur] = 2
+
+    right = np.array(right_flat, dtype=bool).reshape(rows, cols - 1)
+    down = np.array(down_flat, dtype=bool).reshape(rows - 1, cols)
+    return passages_to_tem(n, n, right, down)
+
+
+def eller_rows(
+    height: int,
+    width: int,
+    seed: Optional[int] = None
+) -> Iterator[np.ndarray]:
+    """
+    Generuje dokonalé bludiště Ellerovým algoritmem po jednotlivých řádcích.
+
+    V paměti se drží pouze množiny aktuálního řádku místností,
+    paměťová náročnost je tedy O(width) nezávisle na výšce,
+    a řádky lze rovnou zapisovat na disk.
+
+    Args:
+        height (int): Počet řádků matice (libovolně velký).
+        width (int): Počet sloupců matice.
+        seed (Optional[int]): Semínko generátoru náhodných čísel.
+
+    Yields:
+        np.ndarray: Řádky matice s hodnotami 0 (cesta) a 1 (zdi).
+    """
+    rng = np.random.default_rng(seed)
+    rows = (height + 1) // 2
+    cols = (width + 1) // 2
+
+    sets = np.arange(cols, dtype=np.int64)
+    next_set = cols
+
+    for r in range(rows):
+        last = r == rows - 1
+
+        # 1. náhodné spojení sousedních místností v různých množinách,
+        # v posledním řádku se spojí vše, co ještě spojeno není
+        join = rng.random(cols - 1) < 0.5
+        right = np.zeros(cols - 1, dtype=bool)
+        for c in range(cols - 1):
+            if sets[c] != sets[c + 1] and (last or join[c]):
+                right[c] = True
+                sets[sets == sets[c + 1]] = sets[c]
+
+        row = np.ones(width, dtype=int)
+        row[0:2 * cols - 1:2] = 0
+        row[1:2 * cols - 2:2][right] = 0
+        if last:
+            row[width - 1] = 0
+        yield row
+
+        if last:
+            break
+
+        # 2. průchody dolů, každá množina alespoň jeden
+        down = rng.random(cols) < 0.5
+        pick = rng.random(cols)
+        best: dict = {}
+        for c in range(cols):
+            s = int(sets[c])
+            if s not in best or pick[c] > pick[best[s]]:
+                best[s] = c
+        down[list(best.values())] = True
+
+        row = np.ones(width, dtype=int)
+        row[0:2 * cols - 1:2][down] = 0
+        yield row
+
+        # 3. místnosti bez průchodu shora dostanou novou množinu
+        fresh = np.flatnonzero(~down)
+        sets[fresh] = np.arange(next_set, next_set + len(fresh))
+        next_set += len(fresh)
+
+    if height % 2 == 0:
+        # sudá výška: poslední řádek je zeď s průchodem do cíle
+        row = np.ones(width, dtype=int)
+        row[width - 1] = 0
+        yield row
+
+
+def create_eller_tem(n: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Vytvoří dokonalé bludiště Ellerovým algoritmem (viz eller_rows).
+
+    Args:
+        n (int): Rozměr matice (n x n).
+        seed (Optional[int]): Semínko generátoru náhodných čísel.
+
+    Returns:
+        np.ndarray: Matice s hodnotami 0 (cesta) a 1 (zdi).
+    """
+    return np.array(list(eller_rows(n, n, seed)))
@@ -1,5 +1,8 @@
 import numpy as np
 import os
+import struct
+import zlib
+from typing import BinaryIO, Iterable, Iterator, Optional
 import matplotlib.pyplot as plt
 
 
@@ -87,3 +90,255 @@ def generated_maze_to_image(
     # Uložení obrázku
     plt.imsave(output_path, maze_image)
     print(f"Obrázek bludiště uložen jako '{output_path}'.")
+
+
+"""
+Vykreslování velkých bludišť po částech.
+
+Místo celého RGB obrázku (n x n x 3) se pracuje s jednobajtovými
+značkami buněk (FREE, WALL, PATH), které se rovnou zapisují
+jako indexy do palety PNG. Soubor PNG se zapisuje postupně
+po pásech řádků, takže paměť nezávisí na velikosti obrázku.
+"""
+
+FREE = 0  # bílá - průchozí buňka
+WALL = 1  # černá - zeď
+PATH = 2  # červená - buňka na cestě
+PALETTE = bytes([255, 255, 255, 0, 0, 0, 255, 0, 0])
+# značky jsou seřazené podle priority při zmenšování:
+# cesta přebije zeď a zeď přebije volnou buňku (max-pooling)
+
+
+def _png_chunk(f: BinaryIO, kind: bytes, data: bytes) -> None:
+    """
+    Zapíše jeden blok (chunk) souboru PNG včetně délky a CRC.
+
+    Args:
+        f (BinaryIO): Otevřený výstupní soubor.
+        kind (bytes): Typ bloku (např. b"IDAT").
+        data (bytes): Obsah bloku.
+    """
+    f.write(struct.pack(">I", len(data)))
+    f.write(kind)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+
+def write_png_rows(
+    output_path: str,
+    height: int,
+    width: int,
+    bands: Iterable[np.ndarray]
+) -> None:
+    """
+    Postupně zapíše obrázek PNG s paletou z pásů řádků.
+
+    Args:
+        output_path (str): Cesta k výstupnímu souboru.
+        height (int): Výška obrázku v pixelech.
+        width (int): Šířka obrázku v pixelech.
+        bands (Iterable[np.ndarray]): Pásy řádků (k x width) se značkami
+            FREE / WALL / PATH, dohromady `height` řádků.
+    """
+    compressor = zlib.compressobj()
+    with open(output_path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        _png_chunk(f, b"IHDR", struct.pack(
+            ">IIBBBBB", width, height, 8, 3, 0, 0, 0
+        ))
+        _png_chunk(f, b"PLTE", PALETTE)
+        for band in bands:
+            # každý řádek začíná bajtem filtru (0 = bez filtru)
+            raw = np.zeros((band.shape[0], width + 1), dtype=np.uint8)
+            raw[:, 1:] = band
+            data = compressor.compress(raw.tobytes())
+            if data:
+                _png_chunk(f, b"IDAT", data)
+        _png_chunk(f, b"IDAT", compressor.flush())
+        _png_chunk(f, b"IEND", b"")
+
+
+def maze_labels(
+    maze_map: np.ndarray,
+    path_map: Optional[np.ndarray],
+    start: int = 0,
+    stop: Optional[int] = None
+) -> np.ndarray:
+    """
+    Převede řádky start:stop bludiště na značky FREE / WALL / PATH.
+
+    Args:
+        maze_map (np.ndarray): Logická matice bludiště (True = průchozí).
+        path_map (Optional[np.ndarray]): Logická matice s cestou
+            (True = buňka na cestě), nebo None.
+        start (int): První řádek.
+        stop (Optional[int]): Řádek za posledním (None = až do konce).
+
+    Returns:
+        np.ndarray: Pole značek typu uint8.
+    """
+    labels = np.where(maze_map[start:stop], FREE, WALL).astype(np.uint8)
+    if path_map is not None:
+        labels[path_map[start:stop]] = PATH
+    return labels
+
+
+def pool_labels(labels: np.ndarray, f: int) -> np.ndarray:
+    """
+    Zmenší pole značek f-krát v obou směrech (max-pooling).
+
+    Blok f x f se zobrazí jako cesta, pokud na cestě leží
+    alespoň jedna jeho buňka, jinak jako zeď, pokud obsahuje zeď.
+    Tenké zdi ani cesta tak při zmenšení nezmizí.
+
+    Args:
+        labels (np.ndarray): Pole značek (h x w).
+        f (int): Zmenšovací faktor.
+
+    Returns:
+        np.ndarray: Pole značek (ceil(h / f) x ceil(w / f)).
+    """
+    h, w = labels.shape
+    ph = -(-h // f) * f
+    pw = -(-w // f) * f
+    padded = np.full((ph, pw), FREE, dtype=np.uint8)
+    padded[:h, :w] = labels
+    return padded.reshape(ph // f, f, pw // f, f).max(axis=(1, 3))
+
+
+def solved_maze_to_png_stream(
+    maze_map: np.ndarray,
+    path_map: Optional[np.ndarray],
+    nazev: str,
+    scale: int = 1,
+    band: int = 256
+) -> None:
+    """
+    Uloží vyřešené bludiště jako PNG postupně po pásech řádků.
+
+    Barvy odpovídají solved_maze_to_image, ale celý RGB obrázek
+    se nikdy nevytvoří, v paměti je vždy jen `band` řádků bludiště.
+
+    Výsledný obrázek se uloží do složky 'solved_mazes'.
+
+    Args:
+        maze_map (np.ndarray): Logická matice bludiště (True = průchozí).
+        path_map (Optional[np.ndarray]): Logická matice s cestou
+            (True = buňka na cestě), nebo None.
+        nazev (str): Název výstupního souboru (bez přípony).
+        scale (int): Počet pixelů na jednu buňku v každém směru.
+        band (int): Počet řádků bludiště zpracovaných najednou.
+    """
+    h, w = maze_map.shape
+
+    def bands() -> Iterator[np.ndarray]:
+        for start in range(0, h, band):
+            labels = maze_labels(maze_map, path_map, start, start + band)
+            if scale > 1:
+                labels = labels.repeat(scale, axis=0).repeat(scale, axis=1)
+            yield labels
+
+    output_dir = os.path.join(os.path.dirname(__file__), "..", "solved_mazes")
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f"{nazev}.png")
+
+    write_png_rows(output_path, h * scale, w * scale, bands())
+    print(f"Obrázek bludiště uložen jako '{output_path}'.")
+
+
+def solved_maze_to_tiles(
+    maze_map: np.ndarray,
+    path_map: Optional[np.ndarray],
+    nazev: str,
+    tile: int = 256
+) -> int:
+    """
+    Uloží bludiště jako pyramidu dlaždic pro postupné přibližování.
+
+    Úroveň 0 je celé bludiště v jedné dlaždici, každá další úroveň
+    je dvakrát podrobnější a poslední odpovídá jednomu pixelu na buňku.
+    Zmenšené úrovně vznikají max-poolingem (pool_labels),
+    takže cesta i zdi zůstanou vidět.
+
+    Dlaždice se uloží do složky 'solved_mazes/<nazev>_tiles'
+    jako '<úroveň>/<řádek>_<sloupec>.png'.
+
+    Args:
+        maze_map (np.ndarray): Logická matice bludiště (True = průchozí).
+        path_map (Optional[np.ndarray]): Logická matice s cestou
+            (True = buňka na cestě), nebo None.
+        nazev (str): Název výstupní složky (bez přípony _tiles).
+        tile (int): Velikost dlaždice v pixelech.
+
+    Returns:
+        int: Počet úrovní pyramidy.
+    """
+    output_dir = os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "solved_mazes",
+        f"{nazev}_tiles"
+    )
+
+    labels = maze_labels(maze_map, path_map)
+    levels = 1
+    while max(labels.shape) > tile * 2 ** (levels - 1):
+        levels += 1
+
+    # od nejpodrobnější úrovně, každá další vznikne zmenšením předchozí
+    for z in range(levels - 1, -1, -1):
+        level_dir = os.path.join(output_dir, str(z))
+        os.makedirs(level_dir, exist_ok=True)
+        h, w = labels.shape
+        for ti in range(0, h, tile):
+            for tj in range(0, w, tile):
+                part = labels[ti:ti + tile, tj:tj + tile]
+                write_png_rows(
+                    os.path.join(level_dir, f"{ti // tile}_{tj // tile}.png"),
+                    part.shape[0],
+                    part.shape[1],
+                    [part]
+                )
+        if z > 0:
+            labels = pool_labels(labels, 2)
+
+    print(f"Dlaždice bludiště uloženy do '{output_dir}'.")
+    return levels
+
+
+def solved_maze_thumbnail(
+    maze_map: np.ndarray,
+    path_map: Optional[np.ndarray],
+    nazev: str,
+    size: int = 256
+) -> None:
+    """
+    Uloží náhled bludiště o pevné velikosti size x size pixelů.
+
+    Bludiště se nejprve zmenší max-poolingem (pool_labels)
+    a poté se roztáhne na přesnou velikost metodou nejbližšího souseda.
+
+    Výsledný obrázek se uloží do složky 'solved_mazes'
+    jako '<nazev>_thumb.png'.
+
+    Args:
+        maze_map (np.ndarray): Logická matice bludiště (True = průchozí).
+        path_map (Optional[np.ndarray]): Logická matice s cestou
+            (True = buňka na cestě), nebo None.
+        nazev (str): Název výstupního souboru (bez přípony).
+        size (int): Velikost náhledu v pixelech.
+    """
+    h, w = maze_map.shape
+    f = max(1, -(-max(h, w) // size))
+    labels = pool_labels(maze_labels(maze_map, path_map), f)
+
+    rows = np.arange(size) * labels.shape[0] // size
+    cols = np.arange(size) * labels.shape[1] // size
+    thumb = labels[rows][:, cols]
+
+    output_dir = os.path.join(os.path.dirname(__file__), "..", "solved_mazes")
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f"{nazev}_thumb.png")
+
+    write_png_rows(output_path, size, size, [thumb])
+    print(f"Náhled bludiště uložen jako '{output_path}'.")
@@ -0,0 +1,469 @@
+import heapq
+from functools import cached_property
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
+
+from knihovna.topology import GridTopology, get_topology
+
+"""
+Více řešení bludiště.
+
+create_maze může vyhloubit falešné cesty, které se znovu napojí
+na hlavní cestu, takže bludiště může mít více řešení.
+solve vrací jen první cestu nalezenou BFS, tento modul umí:
+- spočítat nejkratší cesty (count_shortest_paths) dynamickým
+  programováním po vrstvách BFS bez jejich vypisování,
+- najít k nejkratších jednoduchých cest (k_shortest_paths)
+  Yenovým algoritmem nad grafem křižovatek, kde jsou chodby
+  sloučené do hran s délkou.
+Stejně jako v solve je buňka (0, 0) vždy začátkem
+a buňka (n-1, n-1) se považuje za dosažitelnou i tehdy,
+když v matici není označena jako průchozí.
+"""
+
+COUNT_LIMIT = 2 ** 59
+# počty cest se zastaví na této hodnotě, aby nepřetekly int64
+# (i při sečtení 8 sousedů)
+
+
+def _padded_maze(
+    matrix: np.ndarray,
+    connectivity: int
+) -> Tuple[GridTopology, np.ndarray, int, int]:
+    """
+    Připraví matici obalenou rámečkem zdí s průchozím začátkem i cílem.
+
+    Args:
+        matrix (np.ndarray): Čtvercová matice (n x n), True = průchozí.
+        connectivity (int): 4 nebo 8 sousedů.
+
+    Returns:
+        Tuple[GridTopology, np.ndarray, int, int]: Topologie,
+        ploché logické pole průchodnosti, index začátku a cíle.
+    """
+    n = matrix.shape[0]
+    topology = get_topology(n, n, connectivity)
+    passable = topology.pad(np.asarray(matrix, dtype=bool))
+    start = topology.padded_index(0, 0)
+    end = topology.padded_index(n - 1, n - 1)
+    passable[start] = True
+    passable[end] = True
+    return topology, passable, start, end
+
+
+def count_shortest_paths(
+    matrix: np.ndarray,
+    connectivity: int = 4
+) -> Tuple[int, int]:
+    """
+    Spočítá nejkratší cesty z levého horního do pravého dolního rohu.
+
+    BFS postupuje po celých vrstvách (pole indexů) a pro každou buňku
+    sčítá počty cest ze všech sousedů v předchozí vrstvě.
+    Cesty se tedy nevypisují a výpočet je lineární v počtu buněk.
+
+    Args:
+        matrix (np.ndarray): Čtvercová matice (n x n), True = průchozí.
+        connectivity (int): 4 nebo 8 sousedů.
+
+    Returns:
+        Tuple[int, int]: Počet buněk na nejkratší cestě (jako v solve)
+        a počet různých nejkratších cest (nejvýše COUNT_LIMIT).
+        Pokud cesta neexistuje, vrací (0, 0).
+    """
+    topology, passable, start, end = _padded_maze(matrix, connectivity)
+    offsets = np.array(topology.offsets, dtype=np.int64)
+
+    dist = np.full(passable.shape[0], -1, dtype=np.int64)
+    count = np.zeros(passable.shape[0], dtype=np.int64)
+    dist[start] = 0
+    count[start] = 1
+
+    frontier = np.array([start], dtype=np.int64)
+    d = 0
+    while frontier.size and dist[end] < 0:
+        # všichni sousedé vrstvy, každá dvojice (buňka, soused) zvlášť
+        nbs = (frontier[:, None] + offsets[None, :]).ravel()
+        src = np.repeat(frontier, len(offsets))
+        new = passable[nbs] & (dist[nbs] < 0)
+        nbs = nbs[new]
+        src = src[new]
+
+        layer = np.unique(nbs)
+        dist[layer] = d + 1
+        # počet cest do buňky = součet počtů cest jejích předchůdců
+        np.add.at(count, nbs, count[src])
+        count[layer] = np.minimum(count[layer], COUNT_LIMIT)
+
+        frontier = layer
+        d += 1
+
+    if dist[end] < 0:
+        return 0, 0
+    return int(dist[end]) + 1, int(count[end])
+
+
+class JunctionGraph:
+    """
+    Graf bludiště, ve kterém jsou chodby sloučené do hran.
+
+    Uzly jsou křižovatky a slepé konce (buňky s jiným počtem
+    průchozích sousedů než 2), začátek a cíl. Každá chodba mezi dvěma
+    uzly je jedna hrana s délkou rovnou počtu kroků.
+
+    Attributes:
+        topology (GridTopology): Topologie mřížky.
+        start (int): Index začátku v rozšířené mřížce.
+        end (int): Index cíle v rozšířené mřížce.
+        adjacency (Dict[int, List[Tuple[int, int, int]]]): Pro každý uzel
+            seznam (soused, délka, číslo hrany).
+        edge_cells (List[List[int]]): Buňky každé hrany
+            (indexy rozšířené mřížky) od menšího uzlu k většímu.
+    """
+
+    def __init__(self, matrix: np.ndarray, connectivity: int = 4):
+        topology, passable, start, end = _padded_maze(matrix, connectivity)
+        self.topology = topology
+        self.start = start
+        self.end = end
+
+        offsets = topology.offsets
+        degree = np.zeros(passable.shape[0], dtype=np.int64)
+        inner = np.flatnonzero(passable)
+        for off in offsets:
+            degree[inner] += passable[inner + off]
+        is_node = passable & (degree != 2)
+        is_node[start] = True
+        is_node[end] = True
+
+        is_open = passable.tolist()
+        node_list = is_node.tolist()
+        visited = bytearray(len(is_open))
+        self.adjacency: Dict[int, List[Tuple[int, int, int]]] = {
+            int(k): [] for k in np.flatnonzero(is_node)
+        }
+        self.edge_cells: List[List[int]] = []
+
+        # z každého uzlu projdeme všechny vycházející chodby
+        for u in self.adjacency:
+            for off in offsets:
+                first = u + off
+                if not is_open[first]:
+                    continue
+                if node_list[first]:
+                    if u < first:  # sousední uzly, hranu přidáme jednou
+                        self._add_edge([u, first])
+                    continue
+                if visited[first]:
+                    continue  # chodbu už jsme prošli z druhého konce
+                cells = [u, first]
+                prev, cur = u, first
+                while not node_list[cur]:
+                    visited[cur] = 1
+                    for e in offsets:
+                        nxt = cur + e
+                        if nxt != prev and is_open[nxt]:
+                            break
+                    prev, cur = cur, nxt
+                    cells.append(cur)
+                if cur != u:  # smyčky zpět do stejného uzlu vynecháme
+                    self._add_edge(cells)
+
+    def _add_edge(self, cells: List[int]) -> None:
+        """
+        Přidá hranu (chodbu) zadanou seznamem buněk od uzlu k uzlu.
+        """
+        if cells[0] > cells[-1]:
+            cells.reverse()
+        u, v = cells[0], cells[-1]
+        edge = len(self.edge_cells)
+        self.edge_cells.append(cells)
+        self.adjacency[u].append((v, len(cells) - 1, edge))
+        self.adjacency[v].append((u, len(cells) - 1, edge))
+
+    @cached_property
+    def distance_to_end(self) -> Dict[int, int]:
+        """
+        Délka nejkratší cesty z každého uzlu do cíle (bez zákazů).
+
+        Slouží jako heuristika pro A* v shortest_path. Zakázáním uzlů
+        nebo hran se vzdálenosti jen prodlouží, heuristika je tedy
+        přípustná i pro všechna hledání v Yenově algoritmu.
+        """
+        dist = {self.end: 0}
+        heap = [(0, self.end)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            for v, w, _ in self.adjacency[u]:
+                if d + w < dist.get(v, d + w + 1):
+                    dist[v] = d + w
+                    heapq.heappush(heap, (d + w, v))
+        return dist
+
+    @cached_property
+    def next_to_end(self) -> Dict[int, Tuple[int, int]]:
+        """
+        Strom nejkratších cest do cíle: pro každý uzel (kromě cíle),
+        ze kterého se dá do cíle dojít, dvojice (další uzel, hrana)
+        na jedné z jeho nejkratších cest.
+        """
+        to_end = self.distance_to_end
+        nxt = {}
+        for u, d in to_end.items():
+            if u == self.end:
+                continue
+            for v, w, edge in self.adjacency[u]:
+                if to_end.get(v) == d - w:
+                    nxt[u] = (v, edge)
+                    break
+        return nxt
+
+    def tree_path(self, source: int) -> Tuple[List[int], List[int]]:
+        """
+        Vrátí nejkratší cestu z uzlu `source` do cíle po stromu next_to_end.
+
+        Args:
+            source (int): Počáteční uzel (musí být v distance_to_end).
+
+        Returns:
+            Tuple[List[int], List[int]]: Seznam uzlů a seznam hran cesty.
+        """
+        nxt = self.next_to_end
+        nodes = [source]
+        edges = []
+        while nodes[-1] != self.end:
+            v, edge = nxt[nodes[-1]]
+            nodes.append(v)
+            edges.append(edge)
+        return nodes, edges
+
+    def shortest_path(
+        self,
+        source: int,
+        banned_nodes: Set[int],
+        banned_edges: Set[int],
+        limit: Optional[int] = None
+    ) -> Optional[Tuple[int, List[int], List[int]]]:
+        """
+        Najde nejkratší cestu z uzlu `source` do cíle algoritmem A*.
+
+        Jako heuristika se používá distance_to_end, takže se prohledávají
+        hlavně uzly blízko nejkratších cest a ne celé bludiště.
+
+        Args:
+            source (int): Počáteční uzel.
+            banned_nodes (Set[int]): Uzly, přes které nelze jít.
+            banned_edges (Set[int]): Hrany, které nelze použít.
+            limit (Optional[int]): Cesty délky alespoň limit se nehledají
+                (uzly s odhadem >= limit se vůbec neprocházejí).
+
+        Returns:
+            Optional[Tuple[int, List[int], List[int]]]: Délka, seznam uzlů
+            a seznam hran cesty, nebo None, pokud cesta (kratší než limit)
+            neexistuje.
+        """
+        to_end = self.distance_to_end
+        if source not in to_end:
+            return None
+        dist = {source: 0}
+        back: Dict[int, Tuple[int, int]] = {}
+        # při stejném odhadu dáváme přednost uzlům dál od začátku,
+        # v otevřených prostorech s mnoha stejně dlouhými cestami
+        # tak A* míří rovnou k cíli
+        heap = [(to_end[source], 0, source)]
+        while heap:
+            _, d, u = heapq.heappop(heap)
+            d = -d
+            if u == self.end:
+                break
+            if d > dist[u]:
+                continue
+            for v, w, edge in self.adjacency[u]:
+                if v in banned_nodes or edge in banned_edges:
+                    continue
+                if v not in to_end:
+                    continue  # z uzlu v se do cíle nedá dostat
+                if limit is not None and d + w + to_end[v] >= limit:
+                    continue
+                if d + w < dist.get(v, d + w + 1):
+                    dist[v] = d + w
+                    back[v] = (u, edge)
+                    heapq.heappush(heap, (d + w + to_end[v], -(d + w), v))
+        else:
+            return None
+
+        nodes = [self.end]
+        edges = []
+        while nodes[-1] != source:
+            u, edge = back[nodes[-1]]
+            nodes.append(u)
+            edges.append(edge)
+        return dist[self.end], nodes[::-1], edges[::-1]
+
+    def path_cells(
+        self,
+        nodes: List[int],
+        edges: List[int]
+    ) -> List[Tuple[int, int]]:
+        """
+        Převede cestu v grafu na seznam souřadnic buněk.
+
+        Args:
+            nodes (List[int]): Uzly cesty.
+            edges (List[int]): Hrany mezi po sobě jdoucími uzly.
+
+        Returns:
+            List[Tuple[int, int]]: Buňky cesty od začátku do cíle.
+        """
+        cells = [nodes[0]]
+        for u, edge in zip(nodes, edges):
+            part = self.edge_cells[edge]
+            if part[0] != u:
+                part = part[::-1]
+            cells.extend(part[1:])
+        return [self.topology.from_padded(k) for k in cells]
+
+
+def k_shortest_paths(
+    matrix: np.ndarray,
+    k: int,
+    connectivity: int = 4
+) -> List[Tuple[int, List[Tuple[int, int]]]]:
+    """
+    Najde k nejkratších jednoduchých cest Yenovým algoritmem.
+
+    Hledá se v grafu JunctionGraph, takže se pracuje jen s křižovatkami
+    a ne s každou buňkou chodby. První cesta se vezme ze stromu
+    nejkratších cest do cíle (next_to_end). Při odbočce z uzlu spur
+    je w + distance_to_end[v] přes nejlepší povolenou hranu (spur, v)
+    dolní mezí délky odbočky; pokud cesta ze v po stromu nevede přes
+    kořen ani zpět přes spur, je tato mez dosažena a odbočka je hotová
+    bez hledání. Jen ve zbylých případech se spouští A* (shortest_path).
+
+    Pro kontrolu, zda má bludiště i jiné (delší) řešení, stačí k=2;
+    pro n = 1000 to trvá asi 2–6 s podle typu bludiště,
+    z toho většinu sestavení grafu.
+
+    Args:
+        matrix (np.ndarray): Čtvercová matice (n x n), True = průchozí.
+        k (int): Počet hledaných cest.
+        connectivity (int): 4 nebo 8 sousedů.
+
+    Returns:
+        List[Tuple[int, List[Tuple[int, int]]]]: Nejvýše k dvojic
+        (počet buněk na cestě, seznam souřadnic buněk),
+        seřazených od nejkratší.
+    """
+    graph = JunctionGraph(matrix, connectivity)
+    to_end = graph.distance_to_end
+    if graph.start not in to_end or k < 1:
+        return []
+    nodes, edges = graph.tree_path(graph.start)
+
+    # cesty jsou čtveřice (délka, uzly, hrany, index odbočení)
+    found = [(to_end[graph.start], nodes, edges, 0)]
+    seen = {tuple(edges)}
+    candidates: List[Tuple[int, List[int], List[int], int]] = []
+    nxt = graph.next_to_end
+
+    while len(found) < k:
+        _, prev_nodes, prev_edges, deviation = found[-1]
+        needed = k - len(found)
+        # pořadí uzlů na předchozí cestě; low[v] je nejmenší pořadí uzlu
+        # této cesty na stromové cestě z v do cíle (mimo cestu = len)
+        rank = {u: i for i, u in enumerate(prev_nodes)}
+        low = {graph.end: rank[graph.end]}
+
+        def lowest_rank(v: int) -> int:
+            stack = []
+            while v not in low:
+                stack.append(v)
+                v = nxt[v][0]
+            r = low[v]
+            for u in reversed(stack):
+                r = min(r, rank.get(u, len(prev_nodes)))
+                low[u] = r
+            return r
+
+        root_cost = sum(
+            len(graph.edge_cells[edge]) - 1
+            for edge in prev_edges[:deviation]
+        )
+        # odbočky před místem, kde se cesta oddělila od své předchozí,
+        # už byly vyzkoušené (Lawlerova úprava Yenova algoritmu)
+        for i in range(deviation, len(prev_nodes) - 1):
+            if i > deviation:
+                root_cost += len(graph.edge_cells[prev_edges[i - 1]]) - 1
+            # odbočka z i-tého uzlu, kořen cesty zůstává stejný
+            spur = prev_nodes[i]
+            root_nodes = prev_nodes[:i + 1]
+            root_edges = prev_edges[:i]
+
+            # pokud máme dost kandidátů, které nejsou delší než nejlepší
+            # možná cesta přes tuto odbočku, nemusíme ji hledat
+            limit = None
+            if len(candidates) >= needed:
+                limit = heapq.nsmallest(needed, candidates)[-1][0]
+                if root_cost + to_end[spur] >= limit:
+                    continue
+
+            # kořen porovnáváme podle hran, mezi dvěma uzly
+            # může vést více různých chodeb
+            banned_edges = {
+                edges[i] for _, _, edges, _ in found
+                if edges[:i] == root_edges
+            }
+            banned_nodes = set(root_nodes[:-1])
+
+            # nejlepší povolená první hrana odbočky
+            bound = None
+            tree_start = None
+            for v, w, edge in graph.adjacency[spur]:
+                if (
+                    v in banned_nodes or edge in banned_edges
+                    or v not in to_end
+                ):
+                    continue
+                cost = w + to_end[v]
+                if bound is None or cost < bound:
+                    bound = cost
+                    tree_start = None
+                if cost == bound and tree_start is None:
+                    if lowest_rank(v) > i:
+                        tree_start = (v, edge)
+            if bound is None:
+                continue
+            if limit is not None and root_cost + bound >= limit:
+                continue  # přesnější mez přes první hranu odbočky
+
+            if tree_start is not None:
+                # mez je dosažena stromovou cestou, A* není potřeba
+                v, edge = tree_start
+                nodes, edges = graph.tree_path(v)
+                spur_path = (bound, [spur] + nodes, [edge] + edges)
+            else:
+                spur_path = graph.shortest_path(
+                    spur, banned_nodes, banned_edges,
+                    None if limit is None else limit - root_cost
+                )
+                if spur_path is None:
+                    continue
+
+            cost, nodes, edges = spur_path
+            total_edges = root_edges + edges
+            if tuple(total_edges) not in seen:
+                seen.add(tuple(total_edges))
+                heapq.heappush(candidates, (
+                    root_cost + cost, root_nodes[:-1] + nodes, total_edges, i
+                ))
+
+        if not candidates:
+            break
+        found.append(heapq.heappop(candidates))
+
+    return [
+        (cost + 1, graph.path_cells(nodes, edges))
+        for cost, nodes, edges, _ in found
+    ]
@@ -2,6 +2,9 @@ from collections import deque
 import numpy as np
 from typing import Optional, Tuple, List
 
+from knihovna import kernels
+from knihovna.topology import get_topology
+
 """
 Zvolil jsem průchod BFS (Breadth-First Search) pro hledání cesty v bludišti,
 protože BFS je vhodný pro hledání nejkratší cesty
@@ -17,6 +20,7 @@ def get_neighbors(i: int, j: int, n: int) -> List[Tuple[int, int]]:
 
     Sousedé jsou definováni jako buňky nahoře, dole, vlevo a vpravo,
     pokud zůstávají uvnitř hranic matice.
+    Směry se berou z předpočítané topologie mřížky (get_topology).
 
     Args:
         i (int): Řádek aktuální buňky.
@@ -26,18 +30,7 @@ def get_neighbors(i: int, j: int, n: int) -> List[Tuple[int, int]]:
     Returns:
         List[Tuple[int, int]]: Seznam souřadnic sousedních buněk.
     """
-    neighbors = []
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    # nahoru, dolů, vlevo, vpravo
-
-    for di, dj in directions:
-        ni, nj = i + di, j + dj
-        if 0 <= ni < n and 0 <= nj < n:
-            # zkontrolujeme, jestli je potenciální soused v rámci matice
-            neighbors.append((ni, nj))
-            # přidáme souseda jako dvojici (řádek, sloupec)
-
-    return neighbors
+    return get_topology(n, n).neighbors(i, j)
 
 
 def show_path(
@@ -53,6 +46,9 @@ def show_path(
     - počet kroků,
     - seznam souřadnic buněk na cestě (od začátku do cíle).
 
+    solve ji už nepoužívá (cestu skládá přímo z plochého pole předků),
+    funkce zůstává jen kvůli zpětné kompatibilitě.
+
     Args:
         n (int): Velikost matice (n x n).
         parent_map (np.ndarray): Pole s odkazy na předchozí buňky.
@@ -84,7 +80,8 @@ def show_path(
 
 
 def solve(
-        matrix: np.ndarray
+        matrix: np.ndarray,
+        connectivity: int = 4
 ) -> Optional[Tuple[np.ndarray, int, List[Tuple[int, int]]]]:
     """
     Najde průchozí cestu z levého horního
@@ -94,9 +91,14 @@ def solve(
     do buňky (n-1, n-1) přes hodnoty True (průchozí buňky).
     Pokud cesta existuje, vrací její podobu.
 
+    Prohledává se matice obalená rámečkem zdí (GridTopology.pad),
+    takže sousedy lze získat prostým přičtením posunů
+    bez kontroly hranic.
+
     Args:
         matrix (np.ndarray): Čtvercová matice (n x n),
         kde True značí průchozí buňky.
+        connectivity (int): 4 (bez úhlopříček) nebo 8 sousedů.
 
     Returns:
         Optional[Tuple[np.ndarray, int, List[Tuple[int, int]]]]:
@@ -107,42 +109,64 @@ def solve(
             Jinak: None.
     """
     n = matrix.shape[0]
-    state_map = np.full(matrix.shape, "unknown", dtype=object)
-    # počáteční stav všech buněk je "unknown",
-    # v průběhu prohledávání se mění na "discovered" a "finished"
-    parent_map = np.full(matrix.shape, None, dtype=object)
-    # parent_map slouží k uchování "předků", abychom mohli sledovat cestu zpět.
-    # pro konkrétní buňky bude obsahovat dvojice (i, j) pro jejich předka.
-    # dtype=object -> NumPy musí vědět,
-    # že ty položky jsou obecné Python objekty.
-    # položky jsou buď dvojice (i, j)
-    # nebo None (pro počáteční buňku) pro parent_map
-    # a "unknown", "discovered", "finished" pro state_map
-    queue = deque()
-
-    state_map[0, 0] = "discovered"
-    parent_map[0, 0] = None
-    # počáteční buňka nemá žádného předka
-    queue.append((0, 0))  # algoritmus vždy začneme v levém horním rohu
-
-    while queue:
-        # klasický bsf algoritmus
-        i, j = queue.popleft()
-        for ni, nj in get_neighbors(i, j, n):
-            if (ni, nj) == (n-1, n-1):
-                # pokud jsme dosáhli pravého dolního rohu, můžeme skončit
-                parent_map[ni, nj] = (i, j)
-                # p teď nepotřebujeme, proto _
-                path_map, p, path_steps = show_path(n, parent_map, (n-1, n-1))
-                return path_map, p, path_steps
-            if state_map[ni, nj] == "unknown" and matrix[ni, nj]:
-                # pokud je buňka neznámá a je průchozí (True),
-                # přidáme ji do fronty
-                state_map[ni, nj] = "discovered"
-                parent_map[ni, nj] = (i, j)
-                queue.append((ni, nj))
-        state_map[i, j] = "finished"
-
-    # Pokud se sem dostaneme, žádná cesta neexistuje
-    print("Cesta nebyla nalezena.")
-    return None
+    topology = get_topology(n, n, connectivity)
+    passable = topology.pad(np.asarray(matrix, dtype=bool))
+    # indexy počáteční a cílové buňky v rozšířené mřížce
+    start = topology.padded_index(0, 0)
+    end = topology.padded_index(n - 1, n - 1)
+
+    steps = None
+    if kernels.USE_NUMBA:
+        # přeložené jádro (numba) dává stejnou cestu jako BFS níže
+        parent, found = kernels.bfs_parents(
+            passable,
+            np.array(topology.offsets, dtype=np.int64),
+            start,
+            end
+        )
+        if found:
+            steps = kernels.trace_path(parent, end)
+    else:
+        # klasický bfs algoritmus nad seznamy Pythonu
+        is_open = passable.tolist()
+        parent_list = [-1] * len(is_open)
+        # parent_list slouží k uchování "předků" (-1 = bez předka),
+        # abychom mohli sledovat cestu zpět
+        discovered = bytearray(len(is_open))
+        discovered[start] = 1
+        queue = deque([start])  # vždy začneme v levém horním rohu
+        offsets = topology.offsets
+
+        while queue and steps is None:
+            cur = queue.popleft()
+            for d in offsets:
+                nb = cur + d
+                if nb == end:
+                    # pokud jsme dosáhli pravého dolního rohu, můžeme skončit
+                    parent_list[nb] = cur
+                    steps = []
+                    while nb != -1:
+                        steps.append(nb)
+                        nb = parent_list[nb]
+                    steps.reverse()
+                    break
+                if not discovered[nb] and is_open[nb]:
+                    # pokud je buňka neznámá a je průchozí (True),
+                    # přidáme ji do fronty (rámeček je vždy zeď)
+                    discovered[nb] = 1
+                    parent_list[nb] = cur
+                    queue.append(nb)
+
+    if steps is None:
+        # Pokud se sem dostaneme, žádná cesta neexistuje
+        print("Cesta nebyla nalezena.")
+        return None
+
+    # převod indexů rozšířené mřížky zpět na souřadnice (i, j)
+    rows, cols = np.divmod(np.array(steps), topology.padded_width)
+    rows -= 1
+    cols -= 1
+    path_map = np.full((n, n), False, dtype=bool)
+    path_map[rows, cols] = True
+    path_steps = list(zip(rows.tolist(), cols.tolist()))
+    return path_map, len(path_steps), path_steps
@@ -0,0 +1,184 @@
+from functools import cached_property, lru_cache
+from typing import List, Tuple
+import numpy as np
+
+"""
+Předpočítané sousedství buněk mřížky.
+
+Místo toho, aby se pro každou buňku znovu skládal seznam směrů
+a kontrolovaly hranice, se pro daný tvar mřížky jednou připraví:
+- posuny sousedů v plochém indexu rozšířené (padded) mřížky,
+  kde je kolem matice rámeček o šířce 1, takže vnitřní buňky
+  nepotřebují kontrolu hranic,
+- tabulka sousedů v plochém indexu i * width + j
+  (sousedé zarovnaní na začátek řádku, -1 = chybějící soused),
+- maska okrajových buněk.
+Objekty se sdílejí přes get_topology (cache podle tvaru).
+"""
+
+DIRECTIONS_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+# nahoru, dolů, vlevo, vpravo (pořadí, ve kterém BFS prochází sousedy)
+DIRECTIONS_8 = DIRECTIONS_4 + ((-1, -1), (-1, 1), (1, -1), (1, 1))
+# navíc úhlopříčky: vlevo nahoru, vpravo nahoru, vlevo dolů, vpravo dolů
+
+
+class GridTopology:
+    """
+    Sousedství buněk pro mřížku daného tvaru a typu propojení.
+
+    Attributes:
+        height (int): Počet řádků mřížky.
+        width (int): Počet sloupců mřížky.
+        connectivity (int): 4 nebo 8 sousedů.
+        directions (Tuple[Tuple[int, int], ...]): Směry (di, dj).
+        padded_width (int): Šířka rozšířené mřížky (width + 2).
+        offsets (Tuple[int, ...]): Posuny sousedů v plochém indexu
+            rozšířené mřížky, ve stejném pořadí jako directions.
+    """
+
+    def __init__(self, height: int, width: int, connectivity: int = 4):
+        if connectivity == 4:
+            self.directions = DIRECTIONS_4
+        elif connectivity == 8:
+            self.directions = DIRECTIONS_8
+        else:
+            raise ValueError("Propojení musí být 4 nebo 8.")
+        self.height = height
+        self.width = width
+        self.connectivity = connectivity
+        self.padded_width = width + 2
+        self.offsets = tuple(
+            di * self.padded_width + dj for di, dj in self.directions
+        )
+
+    @cached_property
+    def neighbor_table(self) -> np.ndarray:
+        """
+        Tabulka sousedů (height * width x connectivity)
+        v plochém indexu i * width + j.
+
+        Sousedé uvnitř mřížky jsou v každém řádku na začátku
+        (v pořadí directions), zbytek řádku vyplňuje -1.
+        Náhodného souseda lze tedy vybrat jako
+        table[k, int(u * neighbor_count[k])].
+        """
+        rows, cols = np.divmod(
+            np.arange(self.height * self.width), self.width
+        )
+        table = np.empty(
+            (self.height * self.width, self.connectivity), dtype=np.int64
+        )
+        for d, (di, dj) in enumerate(self.directions):
+            ni = rows + di
+            nj = cols + dj
+            inside = (
+                (ni >= 0) & (ni < self.height)
+                & (nj >= 0) & (nj < self.width)
+            )
+            table[:, d] = np.where(inside, ni * self.width + nj, -1)
+        # stabilní seřazení přesune -1 na konec řádku a zachová pořadí
+        order = np.argsort(table < 0, axis=1, kind="stable")
+        return np.take_along_axis(table, order, axis=1)
+
+    @cached_property
+    def neighbor_count(self) -> np.ndarray:
+        """
+        Počet sousedů uvnitř mřížky pro každou buňku (plochý index).
+        """
+        return (self.neighbor_table >= 0).sum(axis=1)
+
+    @cached_property
+    def border_mask(self) -> np.ndarray:
+        """
+        Logická matice (height x width), True pro okrajové buňky.
+        """
+        mask = np.zeros((self.height, self.width), dtype=bool)
+        mask[0, :] = True
+        mask[-1, :] = True
+        mask[:, 0] = True
+        mask[:, -1] = True
+        return mask
+
+    def neighbors(self, i: int, j: int) -> List[Tuple[int, int]]:
+        """
+        Vrací seznam sousedů buňky (i, j) uvnitř mřížky.
+
+        Args:
+            i (int): Řádek buňky.
+            j (int): Sloupec buňky.
+
+        Returns:
+            List[Tuple[int, int]]: Souřadnice sousedních buněk.
+        """
+        if 0 < i < self.height - 1 and 0 < j < self.width - 1:
+            # vnitřní buňka, hranice není potřeba kontrolovat
+            return [(i + di, j + dj) for di, dj in self.directions]
+        return [
+            (i + di, j + dj) for di, dj in self.directions
+            if 0 <= i + di < self.height and 0 <= j + dj < self.width
+        ]
+
+    def pad(self, matrix: np.ndarray, fill=False) -> np.ndarray:
+        """
+        Vrátí matici obalenou rámečkem hodnot `fill` jako ploché pole.
+
+        Args:
+            matrix (np.ndarray): Matice (height x width).
+            fill: Hodnota rámečku (např. False = zeď).
+
+        Returns:
+            np.ndarray: Ploché pole délky (height + 2) * (width + 2).
+        """
+        padded = np.full(
+            (self.height + 2, self.padded_width), fill, dtype=matrix.dtype
+        )
+        padded[1:-1, 1:-1] = matrix
+        return padded.ravel()
+
+    def padded_index(self, i: int, j: int) -> int:
+        """
+        Převede souřadnice (i, j) na plochý index v rozšířené mřížce.
+        """
+        return (i + 1) * self.padded_width + (j + 1)
+
+    def from_padded(self, k: int) -> Tuple[int, int]:
+        """
+        Převede plochý index rozšířené mřížky zpět na souřadnice (i, j).
+        """
+        i, j = divmod(k, self.padded_width)
+        return i - 1, j - 1
+
+
+def get_topology(
+    height: int,
+    width: int,
+    connectivity: int = 4
+) -> GridTopology:
+    """
+    Vrátí sdílený objekt GridTopology pro daný tvar mřížky.
+
+    Argumenty se předávají do cache vždy všechny a pozičně,
+    takže get_topology(n, n) i get_topology(n, n, 4)
+    vrátí tentýž objekt.
+
+    Args:
+        height (int): Počet řádků mřížky.
+        width (int): Počet sloupců mřížky.
+        connectivity (int): 4 nebo 8 sousedů.
+
+    Returns:
+        GridTopology: Objekt uložený v cache.
+    """
+    return _get_topology(int(height), int(width), int(connectivity))
+
+
+@lru_cache(maxsize=16)
+def _get_topology(
+    height: int,
+    width: int,
+    connectivity: int
+) -> GridTopology:
+    """
+    Vytvoří GridTopology, cache klíčuje podle (height, width, connectivity).
+    """
+    return GridTopology(height, width, connectivity)